@@ -19,6 +19,7 @@ __all__ = ["Observer", "ServiceStartedEvent", "ServiceStoppedEvent"]
 
 import argparse
 import asyncio
+import errno
 import logging
 import os
 import re
@@ -26,11 +27,13 @@ import shutil
 import signal
 import sys
 import textwrap
+import threading
 from pathlib import Path
-from typing import Dict, List, Union, TypeVar
+from typing import Dict, List, Optional, Tuple, Union, TypeVar
 
 from dbus_next.aio import MessageBus
 from dbus_next.errors import DBusError
+from dbus_next.introspection import Node
 from dbus_next.message import Message
 from dbus_next.constants import BusType, MessageType
 
@@ -41,22 +44,38 @@ PYDEPS = ["dbus-next>=0.2.3"]
 
 LIBID = "TESTINGPURPOSESONLY"
 LIBAPI = 0
-LIBPATCH = 1
+LIBPATCH = 2
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 SERVICE_STATES = {}
-SERVICE_HOOK_RE = re.compile(r"service-(?P<service>[\w\\:-]*)-(?:started|stopped)")
-
-DBUS_CHAR_MAPPINGS = {
-    '_40': '@',
-    '_2e': '.',
-    '_5f': '_',
-    '_2d': '-',
-    '_5c': '\\',
-}
+# Maps each watched service to its dbus object path.
+SERVICE_OBJECT_PATHS: Dict[str, str] = {}
+# Maps the dbus object path of each watched service to the service name.
+PATH_TO_SERVICE: Dict[str, str] = {}
+# The hook name and juju-exec command for each event, per service.
+HOOK_CMDS: Dict[str, Dict[str, Tuple[str, List[str], str]]] = {}
+_BUS = None
+# Serializes the hooks run for each service.
+_SERVICE_LOCKS: Dict[str, asyncio.Semaphore] = {}
+# The latest pending notification for each (service, event) pair.
+_PENDING_EVENTS: Dict[Tuple[str, str], object] = {}
+# The last event (started or stopped) a hook was run for, per service.
+_NOTIFIED_EVENTS: Dict[str, str] = {}
+# Introspection data of unit objects, keyed by object path.
+_INTROSPECTION_CACHE: Dict[str, Node] = {}
+# Seconds to wait for further state changes before running a service hook.
+NOTIFY_DEBOUNCE = 0.1
+SERVICE_HOOK_PREFIX = "service-"
+SERVICE_HOOK_SUFFIXES = ("-started", "-stopped")
+SERVICE_NAME_RE = re.compile(r"[\w\\:-]+", re.ASCII)
+
+# Escaped form of each byte in a dbus object path element, as done by systemd.
+DBUS_ESCAPES = tuple(
+    chr(b) if chr(b).isascii() and chr(b).isalnum() else f"_{b:02x}" for b in range(256)
+)
 
 
 class _ServiceEvent(EventBase):
@@ -115,38 +134,46 @@ class Observer(Object):
     def subscribe(self) -> None:
         """Subscribe observer to registered services."""
         # Generate hooks for observer events.
+        dispatch = Path.cwd() / "dispatch"
         for service in self._services:
-            shutil.copy(f"{Path.cwd()}/dispatch", f"hooks/service-{service}-started")
-            shutil.copy(f"{Path.cwd()}/dispatch", f"hooks/service-{service}-stopped")
+            _install_hook(dispatch, Path(f"hooks/service-{service}-started"))
+            _install_hook(dispatch, Path(f"hooks/service-{service}-stopped"))
 
         # Generate and start observer daemon using systemd.
+        content = textwrap.dedent(
+            f"""
+            [Unit]
+            Description=Juju systemd notices daemon
+            After=multi-user.target
+
+            [Service]
+            Type=simple
+            Restart=always
+            ExecStart=/usr/bin/python3 {__file__} {self._charm.unit.name}
+            WorkingDirectory={Path.cwd()}
+            Environment=PYTHONPATH={Path.cwd()/"venv"}
+
+            [Install]
+            WantedBy=multi-user.target
+            """
+        ).strip()
         if self._service_file.exists():
+            if self._service_file.read_text() == content:
+                logger.debug(f"Service file {self._service_file.name} is up to date")
+                return
             logger.debug(f"Overwriting existing service file {self._service_file.name}")
-        self._service_file.write_text(
-            textwrap.dedent(
-                f"""
-                [Unit]
-                Description=Juju systemd notices daemon
-                After=multi-user.target
-
-                [Service]
-                Type=simple
-                Restart=always
-                ExecStart=/usr/bin/python3 {__file__} {self._charm.unit.name}
-                WorkingDirectory={Path.cwd()}
-                Environment=PYTHONPATH={Path.cwd()/"venv"}
-
-                [Install]
-                WantedBy=multi-user.target
-                """
-            ).strip()
-        )
+        _write_atomic(self._service_file, content)
         logger.debug(f"Service file {self._service_file.name} created. Reloading systemd")
-        self._systemd.reload()
         svc = self._service_file.name
-        logger.debug(f"Starting {svc} daemon")
-        self._systemd.enable(svc)
-        self._systemd.start_unit(svc, "fail")
+        try:
+            self._systemd.reload()
+            logger.debug(f"Starting {svc} daemon")
+            self._systemd.enable(svc)
+            self._systemd.start_unit(svc, "fail")
+        except Exception:
+            # Remove the service file so the next subscribe retries the setup.
+            self._service_file.unlink()
+            raise
 
     def stop(self) -> None:
         """Stop the observer from observing subscriptions."""
@@ -154,21 +181,39 @@ class Observer(Object):
         logger.debug(f"Stopping {svc} daemon")
         self._systemd.stop_unit(svc)
         self._systemd.disable(svc)
+        # Remove the service file so a later subscribe sets the daemon up again.
+        self._service_file.unlink(missing_ok=True)
 
 
 class Systemd:
 
-    @staticmethod
-    async def _get_systemd_manager():
-        """
+    def __init__(self) -> None:
+        self._bus = None
+        self._mgr = None
+        self._lock = None
+        self._loop = None
 
-        :return:
+    async def _get_systemd_manager(self):
+        """Returns the org.freedesktop.systemd1.Manager interface.
+
+        The bus connection and the introspected Manager proxy are created once
+        and reused for subsequent calls.
+
+        :return: the systemd Manager interface
         """
-        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-        api = await bus.introspect("org.freedesktop.systemd1", "/org/freedesktop/systemd1")
-        proxy = bus.get_proxy_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1", api)
-        mgr = proxy.get_interface("org.freedesktop.systemd1.Manager")
-        return mgr
+        if self._lock is None:
+            # Created here so the lock is bound to the background loop.
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._mgr is None:
+                self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+                api = await self._bus.introspect("org.freedesktop.systemd1",
+                                                 "/org/freedesktop/systemd1")
+                proxy = self._bus.get_proxy_object("org.freedesktop.systemd1",
+                                                   "/org/freedesktop/systemd1", api)
+                self._mgr = proxy.get_interface("org.freedesktop.systemd1.Manager")
+        return self._mgr
 
     async def _async_dbus_call(self, function, *args, **kwargs) -> T:
         """
@@ -190,11 +235,15 @@ class Systemd:
         :param kwargs:
         :return:
         """
-        try:
-            loop = asyncio.get_running_loop()
-            return loop.run_until_complete(self._async_dbus_call(function, *args, **kwargs))
-        except RuntimeError:
-            return asyncio.run(self._async_dbus_call(function, *args, **kwargs))
+        if self._loop is None:
+            # All dbus calls are submitted to a single long-lived loop so the
+            # bus connection can be reused across calls. It is only started
+            # once a call is made.
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        future = asyncio.run_coroutine_threadsafe(
+            self._async_dbus_call(function, *args, **kwargs), self._loop)
+        return future.result()
 
     def reload(self):
         """Reloads the systemd service files.
@@ -230,33 +279,66 @@ class Systemd:
         return self._dbus_call('disable_unit_files', str(unit))
 
 
-def _name_to_dbus_path(name: str) -> str:
-    """Converts the specified name into an org.freedesktop.systemd1.Unit path handle.
+def _write_atomic(path: Path, content: str) -> None:
+    """Writes content to the specified path atomically.
 
-    :param name: the name of the service
-    :return: string containing the dbus path
+    The content is written to a temporary file alongside the target which is
+    then renamed over it, so readers never observe a partially written file.
+
+    :param path: the path of the file to write
+    :param content: the content to write to the file
+    :return: None
     """
-    # DBUS Object names may only contain ASCII chars [A-Z][a-z][0-9]_
-    # It's basically urlencoded but instead of a %, it uses a _
-    path = name
-    for key, value in DBUS_CHAR_MAPPINGS.items():
-        path = path.replace(value, key)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
 
-    return f"/org/freedesktop/systemd1/unit/{path}"
 
+def _install_hook(dispatch: Path, hook: Path) -> None:
+    """Installs the dispatch script as the specified hook.
 
-def _dbus_path_to_name(path: str) -> str:
-    """Converts the specified DBus path handle to a service name.
+    The hook is hard linked to the dispatch script when possible, falling back
+    to writing out a copy when linking is not possible. Either way the hook is
+    put in place atomically, replacing any existing hook which is not already
+    the dispatch script.
 
-    :param path: the path to convert
-    :return: string containing the service name
+    :param dispatch: path to the charm's dispatch script
+    :param hook: path of the hook to install
+    :return: None
     """
-    # DBUS Object names may oncly contain ASCII chars [A-Z][a-z][0-9]_
-    name = os.path.basename(path)
-    for key, value in DBUS_CHAR_MAPPINGS.items():
-        name = name.replace(key, value)
+    try:
+        if os.path.samefile(dispatch, hook):
+            return
+    except FileNotFoundError:
+        pass
+
+    tmp = hook.with_name(f"{hook.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(dispatch, tmp)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM):
+            raise
+        tmp.write_bytes(dispatch.read_bytes())
+        shutil.copymode(dispatch, tmp)
+    os.replace(tmp, hook)
+
 
-    return name
+def _name_to_dbus_path(name: str) -> str:
+    """Converts the specified name into an org.freedesktop.systemd1.Unit path handle.
+
+    :param name: the name of the service
+    :return: string containing the dbus path
+    """
+    # DBUS Object names may only contain ASCII chars [A-Z][a-z][0-9]_
+    # It's basically urlencoded but instead of a %, it uses a _. Like systemd,
+    # every byte other than [A-Za-z0-9] is escaped, as is a leading digit.
+    data = name.encode()
+    if not data:
+        return "/org/freedesktop/systemd1/unit/_"
+    head = f"_{data[0]:02x}" if chr(data[0]).isdigit() else DBUS_ESCAPES[data[0]]
+    escaped = head + "".join(DBUS_ESCAPES[b] for b in data[1:])
+    return f"/org/freedesktop/systemd1/unit/{escaped}"
 
 
 def _systemd_unit_changed(msg: Message) -> bool:
@@ -269,27 +351,25 @@ def _systemd_unit_changed(msg: Message) -> bool:
     :param msg: the message to process in the callback
     :return: True if the event is processed, False otherwise
     """
-    logger.debug(f"Received message: path: {msg.path}, interface: {msg.interface}, "
-                 f"member: {msg.member}")
-    service = _dbus_path_to_name(msg.path)
-    properties = msg.body[1]
-    if 'ActiveState' not in properties:
+    logger.debug("Received message: path: %s, interface: %s, member: %s",
+                 msg.path, msg.interface, msg.member)
+    service = PATH_TO_SERVICE.get(msg.path)
+    if service is None:
+        logger.debug("Dropping event for unwatched object: %s", msg.path)
         return False
 
-    global SERVICE_STATES
-    if service not in SERVICE_STATES:
-        logger.debug(f"Dropping event for unwatched service: {service}")
+    properties = msg.body[1]
+    if 'ActiveState' not in properties:
         return False
 
     curr_state = properties['ActiveState'].value
-    prev_state = SERVICE_STATES[service]
     # Drop transitioning and duplicate events
-    if curr_state.endswith("ing") or curr_state == prev_state:
-        logger.debug(f"Dropping event - service: {service}, state: {curr_state}")
+    if curr_state.endswith("ing") or curr_state == SERVICE_STATES[service]:
+        logger.debug("Dropping event - service: %s, state: %s", service, curr_state)
         return False
 
     SERVICE_STATES[service] = curr_state
-    logger.debug(f"Service {service} changed state to {curr_state}")
+    logger.debug("Service %s changed state to %s", service, curr_state)
     # Run the hook in a separate thread so the dbus notifications aren't
     # blocked from being received.
     asyncio.create_task(_send_juju_notification(service, curr_state))
@@ -299,31 +379,136 @@ def _systemd_unit_changed(msg: Message) -> bool:
 async def _send_juju_notification(service: str, state: str) -> None:
     """Invokes a Juju hook to notify that a service state has changed.
 
+    Notifications are delayed by NOTIFY_DEBOUNCE seconds and hooks for the same
+    service are run one at a time, in order. A notification is dropped if a newer
+    notification of the same event for the service is pending, or if the last
+    hook run for the service already reported the same event. A burst of state
+    changes thus still reports both a stop and a start, ending with the latest.
+
     :param service: the name of the service which has changed state
     :param state: the state of the service
     :return: None
     """
-    if service.endswith(".service"):
-        service = service[0:-len(".service")]
-    if state == "active":
-        event_name = "started"
-    else:
-        event_name = "stopped"
-    hook = f"service-{service}-{event_name}"
-    cmd = [
-        "/usr/bin/juju-exec",
-        JUJU_UNIT,
-        f"hooks/{hook}"
-    ]
-
-    logger.debug(f"Invoking hook {hook} with command: {' '.join(cmd)}")
-    process = await asyncio.create_subprocess_exec(*cmd, )
-    await process.wait()
+    event_name = "started" if state == "active" else "stopped"
+    hook, cmd, cmd_line = HOOK_CMDS[service][event_name]
+
+    lock = _SERVICE_LOCKS.get(service)
+    if lock is None:
+        lock = _SERVICE_LOCKS[service] = asyncio.Semaphore(1)
+
+    key = (service, event_name)
+    token = object()
+    _PENDING_EVENTS[key] = token
+    await asyncio.sleep(NOTIFY_DEBOUNCE)
+    async with lock:
+        if _PENDING_EVENTS.get(key) is not token:
+            logger.debug("Dropping hook %s superseded by a newer notification", hook)
+            return
+        del _PENDING_EVENTS[key]
+        if _NOTIFIED_EVENTS.get(service) == event_name:
+            logger.debug("Dropping duplicate hook %s", hook)
+            return
+
+        logger.debug("Invoking hook %s with command: %s", hook, cmd_line)
+        process = await asyncio.create_subprocess_exec(*cmd, stdin=asyncio.subprocess.DEVNULL)
+        await process.wait()
+        if not process.returncode:
+            _NOTIFIED_EVENTS[service] = event_name
     if process.returncode:
-        logger.error(f"Hook command '{' '.join(cmd)}' failed with returncode "
-                     f"{process.returncode}")
+        logger.error("Hook command '%s' failed with returncode %s", cmd_line, process.returncode)
     else:
-        logger.info(f"Hook command '{' '.join(cmd)}' succeeded.")
+        logger.info("Hook command '%s' succeeded.", cmd_line)
+
+
+def _hook_commands(service: str) -> Dict[str, Tuple[str, List[str], str]]:
+    """Builds the commands which invoke the hooks for the specified service.
+
+    :param service: the name of the service unit
+    :return: a dict mapping the started and stopped events to a tuple of the
+             hook name, the command to run it and the command as a string
+    """
+    if service.endswith(".service"):
+        service = service[0:-len(".service")]
+    commands = {}
+    for event_name in ("started", "stopped"):
+        hook = f"service-{service}-{event_name}"
+        cmd = [
+            "/usr/bin/juju-exec",
+            JUJU_UNIT,
+            f"hooks/{hook}"
+        ]
+        commands[event_name] = (hook, cmd, " ".join(cmd))
+    return commands
+
+
+def _systemd_owner_changed(msg: Message) -> bool:
+    """Callback for changes of the org.freedesktop.systemd1 bus name owner.
+
+    The owner changes when systemd re-executes, at which point the cached
+    introspection data may no longer be accurate and is discarded.
+
+    :param msg: the message to process in the callback
+    :return: True if the event is processed, False otherwise
+    """
+    if msg.member != 'NameOwnerChanged' or msg.body[0] != 'org.freedesktop.systemd1':
+        return False
+
+    logger.debug("systemd changed owner on the bus, clearing introspection cache")
+    _INTROSPECTION_CACHE.clear()
+    return True
+
+
+async def _introspect(bus: MessageBus, obj_path: str) -> Node:
+    """Retrieves the introspection data of a systemd object.
+
+    Introspection data is cached per object path, so each object is only
+    introspected once until systemd is restarted.
+
+    :param bus: the message bus to query on
+    :param obj_path: the object path to introspect
+    :return: the introspection data of the object
+    """
+    introspection = _INTROSPECTION_CACHE.get(obj_path)
+    if introspection is None:
+        introspection = await bus.introspect("org.freedesktop.systemd1", obj_path)
+        _INTROSPECTION_CACHE[obj_path] = introspection
+    return introspection
+
+
+async def _call_add_match(bus: MessageBus, rule: str) -> None:
+    """Adds the match rule on the bus.
+
+    :param bus: the message bus to add the match rule on
+    :param rule: the match rule to add
+    :return: None
+    """
+    reply = await bus.call(Message(
+        destination='org.freedesktop.DBus',
+        path='/org/freedesktop/DBus',
+        interface='org.freedesktop.DBus',
+        member='AddMatch',
+        signature='s',
+        body=[rule],
+        serial=bus.next_serial(),
+    ))
+    assert reply.message_type == MessageType.METHOD_RETURN
+
+
+async def _add_match(bus: MessageBus, service: str) -> None:
+    """Subscribes to unit property changes for the specified service.
+
+    The match rule is restricted to the service's object path and the
+    org.freedesktop.systemd1.Unit interface so that the bus daemon filters out
+    signals for units which are not being watched.
+
+    :param bus: the message bus to add the match rule on
+    :param service: the service to receive PropertiesChanged signals for
+    :return: None
+    """
+    obj_path = SERVICE_OBJECT_PATHS[service]
+    await _call_add_match(bus, f"type='signal',interface='org.freedesktop.DBus.Properties',"
+                               f"member='PropertiesChanged',path='{obj_path}',"
+                               f"arg0='org.freedesktop.systemd1.Unit'")
 
 
 async def _get_state(bus: MessageBus, service: str) -> str:
@@ -333,10 +518,10 @@ async def _get_state(bus: MessageBus, service: str) -> str:
     :param service: the service to query the state of
     :return: the state of the service, active or inactive
     """
-    obj_path = _name_to_dbus_path(service)
+    obj_path = SERVICE_OBJECT_PATHS[service]
     try:
-        logger.debug(f"Retrieving state for service {service} at object path: {obj_path}")
-        introspection = await bus.introspect("org.freedesktop.systemd1", obj_path)
+        logger.debug("Retrieving state for service %s at object path: %s", service, obj_path)
+        introspection = await _introspect(bus, obj_path)
         proxy = bus.get_proxy_object("org.freedesktop.systemd1", obj_path, introspection)
         properties = proxy.get_interface('org.freedesktop.DBus.Properties')
         state = await properties.call_get('org.freedesktop.systemd1.Unit', 'ActiveState')  # noqa
@@ -347,24 +532,66 @@ async def _get_state(bus: MessageBus, service: str) -> str:
         return "unknown"
 
 
+async def _list_unit_states(bus: MessageBus) -> Dict[str, Tuple[str, str]]:
+    """Retrieves the current state of all units loaded by systemd.
+
+    :param bus: the message bus to query on
+    :return: a dict mapping unit names to a tuple of their ActiveState and dbus
+             object path, empty if the units could not be listed
+    """
+    obj_path = "/org/freedesktop/systemd1"
+    try:
+        introspection = await _introspect(bus, obj_path)
+        proxy = bus.get_proxy_object("org.freedesktop.systemd1", obj_path, introspection)
+        manager = proxy.get_interface("org.freedesktop.systemd1.Manager")
+        # Each unit is a (name, description, load state, active state, sub state,
+        # followed, object path, job id, job type, job path) struct.
+        units = await manager.call_list_units()  # noqa
+    except DBusError as e:
+        # Callers fall back to querying each unit individually.
+        logger.warning("Unable to list systemd units: %s", e)
+        return {}
+    return {unit[0]: (unit[3], unit[6]) for unit in units}
+
+
+def _hook_service_name(hook: str) -> Optional[str]:
+    """Returns the name of the service the specified hook is for.
+
+    :param hook: the name of the hook
+    :return: the service name if the hook is a service-{service}-(started|stopped)
+             hook with a valid service name, None otherwise
+    """
+    if not hook.startswith(SERVICE_HOOK_PREFIX):
+        return None
+    for suffix in SERVICE_HOOK_SUFFIXES:
+        if hook.endswith(suffix):
+            service = hook[len(SERVICE_HOOK_PREFIX):-len(suffix)]
+            # The name ends up in dbus match rules, so restrict it to the
+            # characters allowed in unit names.
+            if SERVICE_NAME_RE.fullmatch(service):
+                return service
+            return None
+    return None
+
+
 def _load_services_sync():
     """Sync method for load_services_async.
 
     This is a synchronous form of the _load_services method. This is called from a
     signal handler which cannot take coroutines, thus this method will schedule a
-    task to run in the current running loop. If a running loop cannot be found, it
-    will run it using the asyncio.run() method.
+    task to run in the current running loop, reusing the daemon's message bus. If a
+    running loop cannot be found, it will run it using the asyncio.run() method.
     """
     try:
         # Make sure an event loop is running to schedule as a task
         asyncio.get_running_loop()
-        asyncio.create_task(_load_services())
+        asyncio.create_task(_load_services(_BUS))
     except RuntimeError:
         # No async event loop running
         asyncio.run(_load_services())
 
 
-async def _load_services():
+async def _load_services(bus: Optional[MessageBus] = None):
     """Loads the services from hooks for the unit.
 
     Parses the hook names found in the charm hooks directory and determines
@@ -378,6 +605,8 @@ async def _load_services():
     that should be watched. Upon finding a service hook it's current ActiveState
     will be queried from systemd to determine it's initial state.
 
+    :param bus: the message bus to query and subscribe on. Defaults to the
+                daemon's bus, connecting a new one if there is none.
     :return: None
     """
     global JUJU_UNIT
@@ -390,41 +619,69 @@ async def _load_services():
 
     watched_services = []
     # Get service-{service}-(started|stopped) hooks defined by the charm.
-    for hook in filter(lambda p: SERVICE_HOOK_RE.match(p.name), hooks_dir.iterdir()):
-        match = SERVICE_HOOK_RE.match(hook.name)
-        watched_services.append(match.group("service"))
+    for hook in hooks_dir.iterdir():
+        service = _hook_service_name(hook.name)
+        if service is not None:
+            watched_services.append(service)
 
     logger.info(f"Services from hooks are {watched_services}")
     if not watched_services:
         return
 
-    bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+    if bus is None:
+        bus = _BUS or await MessageBus(bus_type=BusType.SYSTEM).connect()
 
-    # Loop through all the services and be sure that a new watcher is
-    # started for new ones.
+    # Determine the services which are not yet watched. Each service has both a
+    # started and stopped hook, so duplicates are dropped while keeping order.
+    new_services = []
     for service in watched_services:
         # The .service suffix is not necessary and will cause lookup
         # failures of the service unit when readying the watcher.
         if not service.endswith(".service"):
             service = f"{service}.service"
 
-        if service not in SERVICE_STATES:
-            state = await _get_state(bus, service)
-            logger.debug(f"Adding service '{service}' with initial state: {state}")
-            SERVICE_STATES[service] = state
+        if service not in SERVICE_STATES and service not in new_services:
+            new_services.append(service)
+
+    if not new_services:
+        return
+
+    # Query the initial states of all loaded units at once, using the object
+    # paths systemd reports for them. Units which are not currently loaded are
+    # queried individually and concurrently, then be sure that a new watcher is
+    # started for each new service.
+    unit_states = await _list_unit_states(bus)
+    initial_states = {}
+    unloaded = []
+    for service in new_services:
+        if service in unit_states:
+            initial_states[service], SERVICE_OBJECT_PATHS[service] = unit_states[service]
+        else:
+            SERVICE_OBJECT_PATHS[service] = _name_to_dbus_path(service)
+            unloaded.append(service)
+    states = await asyncio.gather(*(_get_state(bus, s) for s in unloaded))
+    initial_states.update(zip(unloaded, states))
+    for service in new_services:
+        state = initial_states[service]
+        logger.debug(f"Adding service '{service}' with initial state: {state}")
+        SERVICE_STATES[service] = state
+        PATH_TO_SERVICE[SERVICE_OBJECT_PATHS[service]] = service
+        HOOK_CMDS[service] = _hook_commands(service)
+        await _add_match(bus, service)
 
 
 async def _main():
     """Main async entrypoint which will set up the service to listen for events.
 
-    Connects to the system message bus and registers for signals/events on the
-    org.freedesktop.systemd1.Unit object looking for any PropertyChanged events.
+    Connects to the system message bus and registers for PropertiesChanged
+    signals on the org.freedesktop.systemd1.Unit objects of the watched services.
 
     This method additionally sets up signal handlers for various signals to either
     terminate the process or reload the configuration from the hooks directory.
 
     :return: None
     """
+    global _BUS
     stop_event = asyncio.Event()
     loop = asyncio.get_event_loop()
     loop.add_signal_handler(signal.SIGINT, stop_event.set)
@@ -432,19 +689,13 @@ async def _main():
     loop.add_signal_handler(signal.SIGHUP, _load_services_sync)
 
     bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-    await _load_services()
-
-    reply = await bus.call(Message(
-        destination='org.freedesktop.DBus',
-        path='/org/freedesktop/DBus',
-        interface='org.freedesktop.DBus',
-        member='AddMatch',
-        signature='s',
-        body=["path_namespace='/org/freedesktop/systemd1/unit',type='signal',"
-              "interface='org.freedesktop.DBus.Properties'"],
-        serial=bus.next_serial(),
-    ))
-    assert reply.message_type == MessageType.METHOD_RETURN
+    _BUS = bus
+    await _call_add_match(bus, "type='signal',sender='org.freedesktop.DBus',"
+                               "interface='org.freedesktop.DBus',member='NameOwnerChanged',"
+                               "arg0='org.freedesktop.systemd1'")
+    bus.add_message_handler(_systemd_owner_changed)
+    # Match rules for each watched service are added as services are loaded.
+    await _load_services(bus)
     bus.add_message_handler(_systemd_unit_changed)
     await stop_event.wait()
 
@@ -25,10 +25,23 @@ from ops.charm import CharmEvents
 from ops.model import ActiveStatus, BlockedStatus
 from ops.framework import EventBase, EventSource
 import os
-from jinja2 import Environment, FileSystemLoader
 
 logger = logging.getLogger(__name__)
 
+TEST_SERVICE_TMPL = """\
+[Unit]
+Description=Test service
+After=multi-user.target
+
+[Service]
+Type=simple
+Restart=always
+ExecStart=/usr/bin/python3 {charm_dir}/src/test_daemon.py
+
+[Install]
+WantedBy=multi-user.target
+"""
+
 
 class ServiceTestStarted(EventBase):
     """Emitted when systemd service has started."""
@@ -62,8 +75,6 @@ class SystemdEventTestCharm(ops.CharmBase):
 
     def _on_install(self, event: ops.InstallEvent):
         """Handle the install event."""
-        environment = Environment(loader=FileSystemLoader("src/templates/"))
-
         unit_name = self.unit.name.replace('/', '-')
         data = {
             "charm_dir": os.getcwd(),
@@ -72,10 +83,11 @@ class SystemdEventTestCharm(ops.CharmBase):
         }
 
         # Install the systemd service for the test service
-        template = environment.get_template("test.service.tmpl")
-        content = template.render(data)
-        with open("/etc/systemd/system/test.service", "w+") as f:
-            f.writelines(content)
+        content = TEST_SERVICE_TMPL.format(**data)
+        service_file = "/etc/systemd/system/test.service"
+        with open(f"{service_file}.tmp", "w") as f:
+            f.write(content)
+        os.replace(f"{service_file}.tmp", service_file)
 
         # Reload the systemd daemon to read the new service files
         daemon_reload()
@@ -0,0 +1,410 @@
+# Copyright 2023 Billy Olsen
+# See LICENSE file for licensing details.
+
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import ops
+import ops.testing
+from charms.operator_libs_linux.v0 import systemd_notices
+from dbus_next.constants import MessageType
+from dbus_next.errors import DBusError
+from dbus_next.message import Message
+from dbus_next.signature import Variant
+from dbus_next.validators import is_object_path_valid
+
+
+class NoticesCharm(ops.CharmBase):
+    """Minimal charm for exercising the systemd notices Observer."""
+
+
+class TestObserver(unittest.TestCase):
+    def setUp(self):
+        self.harness = ops.testing.Harness(NoticesCharm, meta="name: notices")
+        self.addCleanup(self.harness.cleanup)
+        self.harness.begin()
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = Path(tmp.name)
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        self.addCleanup(os.chdir, cwd)
+        (self.tmp_dir / "hooks").mkdir()
+        (self.tmp_dir / "dispatch").write_text("#!/bin/sh\n")
+        (self.tmp_dir / "dispatch").chmod(0o755)
+
+    def _observer(self, service):
+        observer = systemd_notices.Observer(self.harness.charm, services=[service])
+        observer._service_file = self.tmp_dir / "notices.service"
+        observer._systemd = mock.MagicMock()
+        return observer
+
+    def test_subscribe_skips_unchanged_service_file(self):
+        observer = self._observer("unchanged")
+        observer.subscribe()
+        observer._systemd.reset_mock()
+
+        observer.subscribe()
+        observer._systemd.reload.assert_not_called()
+        observer._systemd.start_unit.assert_not_called()
+
+    def test_subscribe_after_stop(self):
+        observer = self._observer("restarted")
+        observer.subscribe()
+        observer.stop()
+        self.assertFalse(observer._service_file.exists())
+        observer._systemd.reset_mock()
+
+        observer.subscribe()
+        observer._systemd.reload.assert_called_once()
+        observer._systemd.enable.assert_called_once_with("notices.service")
+        observer._systemd.start_unit.assert_called_once_with("notices.service", "fail")
+
+    def test_subscribe_retries_after_failed_setup(self):
+        observer = self._observer("failing")
+        observer._systemd.start_unit.side_effect = RuntimeError("start failed")
+        with self.assertRaises(RuntimeError):
+            observer.subscribe()
+        self.assertFalse(observer._service_file.exists())
+
+        observer._systemd.start_unit.side_effect = None
+        observer._systemd.reset_mock()
+        observer.subscribe()
+        observer._systemd.start_unit.assert_called_once_with("notices.service", "fail")
+
+
+class TestInstallHook(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = Path(tmp.name)
+        self.dispatch = self.tmp_dir / "dispatch"
+        self.dispatch.write_text("#!/bin/sh\n")
+        self.dispatch.chmod(0o755)
+        self.hook = self.tmp_dir / "service-test-started"
+
+    def test_links_new_hook(self):
+        systemd_notices._install_hook(self.dispatch, self.hook)
+        self.assertTrue(os.path.samefile(self.dispatch, self.hook))
+
+    def test_replaces_copied_hook_with_link(self):
+        self.hook.write_text("#!/bin/sh\n")
+        systemd_notices._install_hook(self.dispatch, self.hook)
+        self.assertTrue(os.path.samefile(self.dispatch, self.hook))
+        self.assertFalse(self.hook.with_name(f"{self.hook.name}.tmp").exists())
+
+    def test_copies_hook_when_linking_fails(self):
+        with mock.patch("os.link", side_effect=PermissionError(1, "Operation not permitted")):
+            systemd_notices._install_hook(self.dispatch, self.hook)
+        self.assertFalse(os.path.samefile(self.dispatch, self.hook))
+        self.assertEqual(self.hook.read_text(), "#!/bin/sh\n")
+        self.assertTrue(os.access(self.hook, os.X_OK))
+
+
+class TestListUnitStates(unittest.IsolatedAsyncioTestCase):
+    async def test_list_units_failure_returns_empty(self):
+        error = DBusError("org.freedesktop.DBus.Error.AccessDenied", "denied")
+        with mock.patch.object(systemd_notices, "_introspect", side_effect=error):
+            self.assertEqual(await systemd_notices._list_unit_states(mock.MagicMock()), {})
+
+    async def test_list_units(self):
+        bus = mock.MagicMock()
+        manager = bus.get_proxy_object.return_value.get_interface.return_value
+        manager.call_list_units = mock.AsyncMock(
+            return_value=[
+                [
+                    "test.service",
+                    "Test",
+                    "loaded",
+                    "active",
+                    "running",
+                    "",
+                    "/org/freedesktop/systemd1/unit/test_2eservice",
+                    0,
+                    "",
+                    "/",
+                ],
+            ]
+        )
+        with mock.patch.object(systemd_notices, "_introspect", mock.AsyncMock()):
+            states = await systemd_notices._list_unit_states(bus)
+        self.assertEqual(
+            states, {"test.service": ("active", "/org/freedesktop/systemd1/unit/test_2eservice")}
+        )
+
+
+class TestLoadServices(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        hooks_dir = Path(tmp.name) / "hooks"
+        hooks_dir.mkdir()
+        for hook in (
+            "install",
+            "service-test-started",
+            "service-test-stopped",
+            "service-0day-started",
+        ):
+            (hooks_dir / hook).touch()
+
+        for patcher in (
+            mock.patch.object(systemd_notices, "JUJU_UNIT", "notices/0", create=True),
+            mock.patch.dict(systemd_notices.SERVICE_STATES, clear=True),
+            mock.patch.dict(systemd_notices.SERVICE_OBJECT_PATHS, clear=True),
+            mock.patch.dict(systemd_notices.PATH_TO_SERVICE, clear=True),
+            mock.patch.dict(systemd_notices.HOOK_CMDS, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_load_services(self):
+        # systemd reports its own object path for loaded units, which is used
+        # as is rather than computed from the unit name.
+        listed = {"test.service": ("active", "/org/freedesktop/systemd1/unit/reported")}
+        with mock.patch.object(
+            systemd_notices, "_list_unit_states", mock.AsyncMock(return_value=listed)
+        ), mock.patch.object(
+            systemd_notices, "_get_state", mock.AsyncMock(return_value="unknown")
+        ) as get_state, mock.patch.object(
+            systemd_notices, "_add_match", mock.AsyncMock()
+        ) as add_match:
+            bus = mock.MagicMock()
+            await systemd_notices._load_services(bus)
+
+        get_state.assert_awaited_once_with(bus, "0day.service")
+        self.assertEqual(
+            systemd_notices.SERVICE_STATES, {"test.service": "active", "0day.service": "unknown"}
+        )
+        self.assertEqual(
+            systemd_notices.SERVICE_OBJECT_PATHS,
+            {
+                "test.service": "/org/freedesktop/systemd1/unit/reported",
+                "0day.service": "/org/freedesktop/systemd1/unit/_30day_2eservice",
+            },
+        )
+        self.assertEqual(
+            systemd_notices.PATH_TO_SERVICE,
+            {
+                "/org/freedesktop/systemd1/unit/reported": "test.service",
+                "/org/freedesktop/systemd1/unit/_30day_2eservice": "0day.service",
+            },
+        )
+        self.assertEqual(set(systemd_notices.HOOK_CMDS), {"test.service", "0day.service"})
+        self.assertEqual(
+            sorted(call.args[1] for call in add_match.await_args_list),
+            ["0day.service", "test.service"],
+        )
+
+
+class TestSystemd(unittest.TestCase):
+    def test_loop_started_on_first_call(self):
+        systemd = systemd_notices.Systemd()
+        self.assertIsNone(systemd._loop)
+
+        async def call(function, *args, **kwargs):
+            return function
+
+        with mock.patch.object(systemd, "_async_dbus_call", side_effect=call):
+            self.assertEqual(systemd.reload(), "reload")
+            loop = systemd._loop
+            self.assertEqual(systemd.reload(), "reload")
+        self.assertIs(systemd._loop, loop)
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class TestSendJujuNotification(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        for patcher in (
+            mock.patch.object(systemd_notices, "JUJU_UNIT", "notices/0", create=True),
+            mock.patch.object(systemd_notices, "NOTIFY_DEBOUNCE", 0),
+            mock.patch.dict(systemd_notices.SERVICE_STATES, clear=True),
+            mock.patch.dict(systemd_notices.HOOK_CMDS, clear=True),
+            mock.patch.dict(systemd_notices._NOTIFIED_EVENTS, clear=True),
+            mock.patch.dict(systemd_notices._PENDING_EVENTS, clear=True),
+            mock.patch.dict(systemd_notices._SERVICE_LOCKS, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        systemd_notices.HOOK_CMDS["test.service"] = systemd_notices._hook_commands("test.service")
+
+        self.returncodes = []
+        patcher = mock.patch("asyncio.create_subprocess_exec", side_effect=self._exec)
+        self.exec = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _exec(self, *cmd, **kwargs):
+        process = mock.MagicMock()
+        process.returncode = self.returncodes.pop(0) if self.returncodes else 0
+        process.wait = mock.AsyncMock(return_value=process.returncode)
+        return process
+
+    async def _notify(self, state):
+        systemd_notices.SERVICE_STATES["test.service"] = state
+        await systemd_notices._send_juju_notification("test.service", state)
+
+    def _hooks(self):
+        return [call.args[2] for call in self.exec.call_args_list]
+
+    async def test_runs_hook(self):
+        await self._notify("active")
+        self.exec.assert_called_once_with(
+            "/usr/bin/juju-exec",
+            "notices/0",
+            "hooks/service-test-started",
+            stdin=asyncio.subprocess.DEVNULL,
+        )
+
+    async def test_overtaken_notification_delivered(self):
+        # A stop followed by a start while the stop is waiting on the lock,
+        # e.g. systemctl restart, still reports both events in order.
+        systemd_notices._NOTIFIED_EVENTS["test.service"] = "started"
+        systemd_notices.SERVICE_STATES["test.service"] = "active"
+        await asyncio.gather(
+            systemd_notices._send_juju_notification("test.service", "inactive"),
+            systemd_notices._send_juju_notification("test.service", "active"),
+        )
+        self.assertEqual(
+            self._hooks(), ["hooks/service-test-stopped", "hooks/service-test-started"]
+        )
+
+    async def test_same_event_deduplicated_after_success(self):
+        await self._notify("active")
+        await self._notify("active")
+        self.assertEqual(self._hooks(), ["hooks/service-test-started"])
+
+    async def test_retries_after_failed_hook(self):
+        self.returncodes = [1]
+        await self._notify("active")
+        await self._notify("active")
+        self.assertEqual(self._hooks(), ["hooks/service-test-started"] * 2)
+
+    async def test_burst_keeps_latest_notification_per_event(self):
+        with mock.patch.object(systemd_notices, "NOTIFY_DEBOUNCE", 0.05):
+            tasks = []
+            for state in ("inactive", "active", "inactive"):
+                systemd_notices.SERVICE_STATES["test.service"] = state
+                tasks.append(
+                    asyncio.create_task(
+                        systemd_notices._send_juju_notification("test.service", state)
+                    )
+                )
+            await asyncio.gather(*tasks)
+        self.assertEqual(
+            self._hooks(), ["hooks/service-test-started", "hooks/service-test-stopped"]
+        )
+
+    async def test_restart_within_debounce_runs_stop_and_start(self):
+        systemd_notices._NOTIFIED_EVENTS["test.service"] = "started"
+        with mock.patch.object(systemd_notices, "NOTIFY_DEBOUNCE", 0.05):
+            tasks = []
+            for state in ("inactive", "active"):
+                systemd_notices.SERVICE_STATES["test.service"] = state
+                tasks.append(
+                    asyncio.create_task(
+                        systemd_notices._send_juju_notification("test.service", state)
+                    )
+                )
+            await asyncio.gather(*tasks)
+        self.assertEqual(
+            self._hooks(), ["hooks/service-test-stopped", "hooks/service-test-started"]
+        )
+
+
+class TestSystemdUnitChanged(unittest.TestCase):
+    PATH = "/org/freedesktop/systemd1/unit/test_2eservice"
+
+    def setUp(self):
+        for patcher in (
+            mock.patch.dict(systemd_notices.SERVICE_STATES, {"test.service": "inactive"}),
+            mock.patch.dict(systemd_notices.PATH_TO_SERVICE, {self.PATH: "test.service"}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            systemd_notices, "_send_juju_notification", new_callable=mock.MagicMock
+        )
+        self.send_juju_notification = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("asyncio.create_task")
+        self.create_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _changed(self, path, state):
+        msg = Message(
+            message_type=MessageType.SIGNAL,
+            path=path,
+            interface="org.freedesktop.DBus.Properties",
+            member="PropertiesChanged",
+            signature="sa{sv}as",
+            body=["org.freedesktop.systemd1.Unit", {"ActiveState": Variant("s", state)}, []],
+        )
+        return systemd_notices._systemd_unit_changed(msg)
+
+    def test_state_change_schedules_notification(self):
+        self.assertTrue(self._changed(self.PATH, "active"))
+        self.assertEqual(systemd_notices.SERVICE_STATES["test.service"], "active")
+        self.send_juju_notification.assert_called_once_with("test.service", "active")
+        self.create_task.assert_called_once_with(self.send_juju_notification.return_value)
+
+    def test_unwatched_path_dropped(self):
+        self.assertFalse(self._changed("/org/freedesktop/systemd1/unit/other_2eservice", "active"))
+        self.assertEqual(systemd_notices.SERVICE_STATES, {"test.service": "inactive"})
+        self.create_task.assert_not_called()
+
+    def test_transitional_and_duplicate_states_dropped(self):
+        self.assertFalse(self._changed(self.PATH, "activating"))
+        self.assertFalse(self._changed(self.PATH, "inactive"))
+        self.assertEqual(systemd_notices.SERVICE_STATES["test.service"], "inactive")
+        self.create_task.assert_not_called()
+
+
+class TestHookServiceName(unittest.TestCase):
+    def test_service_hooks(self):
+        self.assertEqual(systemd_notices._hook_service_name("service-test-started"), "test")
+        self.assertEqual(systemd_notices._hook_service_name("service-test-stopped"), "test")
+        self.assertEqual(
+            systemd_notices._hook_service_name("service-my-svc:x-started"), "my-svc:x"
+        )
+
+    def test_other_hooks_ignored(self):
+        for hook in ("install", "service-test", "test-started", "service-test-restarted"):
+            self.assertIsNone(systemd_notices._hook_service_name(hook), hook)
+
+    def test_invalid_service_names_ignored(self):
+        for hook in (
+            "service-started",
+            "service--stopped",
+            "service-te'st-started",
+            "service-a b-started",
+            "service-t\u00e9-started",
+        ):
+            self.assertIsNone(systemd_notices._hook_service_name(hook), hook)
+
+
+class TestNameToDbusPath(unittest.TestCase):
+    def test_escapes_unit_name(self):
+        self.assertEqual(
+            systemd_notices._name_to_dbus_path("foo@bar_baz.service"),
+            "/org/freedesktop/systemd1/unit/foo_40bar_5fbaz_2eservice",
+        )
+        self.assertEqual(
+            systemd_notices._name_to_dbus_path("my-svc\\x.service"),
+            "/org/freedesktop/systemd1/unit/my_2dsvc_5cx_2eservice",
+        )
+
+    def test_escaped_paths_are_valid(self):
+        for name in ("my-svc:x.service", "t\u00e9.service", "0day.service", "a'b.service"):
+            path = systemd_notices._name_to_dbus_path(name)
+            self.assertTrue(is_object_path_valid(path), path)
+        self.assertEqual(
+            systemd_notices._name_to_dbus_path("0day.service"),
+            "/org/freedesktop/systemd1/unit/_30day_2eservice",
+        )